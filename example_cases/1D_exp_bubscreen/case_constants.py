@@ -0,0 +1,69 @@
+## @brief Derived nondimensional constants for the 1D_exp_bubscreen cases.
+##              The reference scales, bubble-dynamics numbers and time-step
+##              counts depend only on a handful of physical inputs, so they
+##              are computed here, for a single case or for all the points of
+##              a parameter sweep at once, instead of being re-derived inline
+##              by every input script of the sweep.
+
+import numpy as np
+
+from collections import namedtuple
+
+#water props
+mul0    = 1.002E-03     #viscosity
+ss      = 0.07275       #surface tension
+# ss      = 1.E-12 ## this would turn-off surface tension
+pv      = 2.3388E+03    #vapor pressure
+
+# Quantities returned by derive()
+CaseConstants = namedtuple('CaseConstants',                                     \
+                           ['c0', 'pa', 'Ca', 'We', 'Re_inv', 't0', 'dt', 'Nt', \
+                            'Nout'])
+
+
+def derive(x0, p0, rho0, vf0, R0ref, pa_Pa, cfl, Nx, Ldomain, cphysical,      \
+           Nfiles=20.): # -----------------------------------------------------
+    # Description: Given the reference length, pressure and density, the bubble
+    #              screen void fraction and reference radius, the dimensional
+    #              acoustic amplitude, the CFL number, the number of cells, the
+    #              dimensional domain length and the physical speed of sound,
+    #              this function returns the nondimensional constants needed
+    #              by the case dictionary. The number of time-steps is rounded
+    #              up so that it is a multiple of the Nfiles output files. Any
+    #              of the inputs may be a NumPy array, in which case all of the
+    #              returned constants are arrays of the broadcast shape.
+
+    x0, p0, rho0, vf0, R0ref, pa_Pa, cfl, Nx, Ldomain, cphysical =             \
+        np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in              \
+        (x0, p0, rho0, vf0, R0ref, pa_Pa, cfl, Nx, Ldomain, cphysical)])
+
+    c0      = np.sqrt( p0/rho0 )
+    pa      = pa_Pa / p0
+
+    #Characteristic velocity
+    uu = np.sqrt( p0/rho0 )
+    #Cavitation number
+    Ca = (p0 - pv)/(rho0*(uu**2.))
+    #Weber number
+    We = rho0*(uu**2.)*R0ref/ss
+    #Inv. bubble Reynolds number
+    Re_inv = mul0/(rho0*uu*R0ref)
+
+    t0      = x0/c0
+
+    # CFL numebr should be < 1  for numerical stability
+    # CFL = speed of sound * dt/dx
+    L       = Ldomain/x0
+    dx      = L/Nx
+    dt      = cfl*dx/(cphysical/c0)
+
+    Lpulse  = 0.3*Ldomain
+    Tpulse  = Lpulse/cphysical
+    Tfinal  = 0.25*10.*Tpulse*c0/x0
+    Nt      = np.floor(Tfinal/dt)
+
+    Nout = np.ceil(Nt/Nfiles).astype(int)
+    Nt = (Nout*Nfiles).astype(int)
+
+    return CaseConstants(c0, pa, Ca, We, Re_inv, t0, dt, Nt, Nout)
+# END: def derive --------------------------------------------------------------
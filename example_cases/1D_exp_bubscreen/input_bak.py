@@ -2,10 +2,33 @@
 
 import math
 
+# Command to navigate between directories
+from os import chdir
+
+# Commands to acquire directory path and full path
+from os.path import abspath, dirname
+
+# Command to acquire script name and module search path
+from sys import argv, path
+
+# Derived nondimensional constants of the case
+from case_constants import derive
+
+# Directory of the case, independent of the working directory of the caller
+case_dir = abspath(dirname(__file__))
+
+# Adding master_scripts directory to module search path, unless a previous
+# execution of the case from the same interpreter already did so
+mfc_dir = abspath(case_dir + '/../../src')
+if mfc_dir + '/master_scripts' not in path:
+    path.insert(0, mfc_dir + '/master_scripts')
+
+# Command to execute the MFC components
+from m_python_proxy import f_execute_mfc_component
+
 x0      = 10.E-06
 p0      = 101325.
 rho0    = 1.E+03
-c0      = math.sqrt( p0/rho0 )
 patm    = 1.
 
 #water props
@@ -14,11 +37,6 @@ n_tait  = 7.1
 ## AKA little \pi(see coralic 2014 eq'n (13))
 B_tait  = 306.E+06 / p0
 
-mul0    = 1.002E-03     #viscosity
-ss      = 0.07275       #surface tension
-# ss      = 1.E-12 ## this would turn-off surface tension
-pv      = 2.3388E+03    #vapor pressure
-
 # water 
 # These _v and _n parameters ONLY correspond to the bubble model of Preston (2010 maybe 2008)
 # (this model would replace the usual Rayleigh-plesset or Keller-miksis model (it's more compilcated))
@@ -39,25 +57,11 @@ gamma_gas = 1.4
 #reference bubble size
 R0ref   = 10.E-06
 
-pa      = 0.1 * 1.E+06 / 101325.
-
-print('pa',pa)
-
-#Characteristic velocity
-uu = math.sqrt( p0/rho0 )
-#Cavitation number
-Ca = (p0 - pv)/(rho0*(uu**2.))
-#Weber number
-We = rho0*(uu**2.)*R0ref/ss
-#Inv. bubble Reynolds number
-Re_inv = mul0/(rho0*uu*R0ref)
-
 #IC setup
 vf0     = 0.00004
 n0      = vf0/(math.pi*4.E+00/3.E+00)
 
 cphysical = 1475.
-t0      = x0/c0
 
 nbubbles = 1 
 myr0    = R0ref
@@ -68,47 +72,31 @@ myr0    = R0ref
 cfl     = 0.1
 Nx      = 100
 Ldomain = 20.E-03
-L       = Ldomain/x0
-dx      = L/float(Nx)
-dt      = cfl*dx/(cphysical/c0)
-
-Lpulse  = 0.3*Ldomain
-Tpulse  = Lpulse/cphysical
-Tfinal  = 0.25*10.*Tpulse*c0/x0
-Nt      = int(Tfinal/dt)
-
-Nfiles = 20.
-Nout = int(math.ceil(Nt/Nfiles))
-Nt = int(Nout*Nfiles)
-
-# Command to navigate between directories
-from os import chdir
 
-# Command to acquire directory path
-from os.path import dirname
+# Number of output files
+Nfiles  = 20.
 
-# Command to acquire script name and module search path
-from sys import argv, path
+# Acoustic amplitude [Pa], reference scales, bubble numbers and time-steps
+const   = derive(x0, p0, rho0, vf0, R0ref, 0.1 * 1.E+06, cfl, Nx, Ldomain, \
+                 cphysical, Nfiles)
 
-# Navigating to script directory
-if len(dirname(argv[0])) != 0: chdir(dirname(argv[0]))
-
-# Adding master_scripts directory to module search path
-mfc_dir = '../../src'; path[:0] = [mfc_dir + '/master_scripts']
-
-# Command to execute the MFC components
-from m_python_proxy import f_execute_mfc_component
+c0      = float(const.c0)
+pa      = float(const.pa)
+Ca      = float(const.Ca)
+We      = float(const.We)
+Re_inv  = float(const.Re_inv)
+t0      = float(const.t0)
+dt      = float(const.dt)
+Nt      = int(const.Nt)
+Nout    = int(const.Nout)
 
 # ==============================================================================
 
 # Case Analysis Configuration ==================================================
 
-# Selecting MFC component
-comp_name = argv[1].strip()
-
-# Serial or parallel computational engine
-engine = 'serial'
-if (comp_name=='pre_process'): engine = 'serial'
+# Number of nodes and processes per node
+nodes = 1
+ppn   = 1
 
 # Configuring case dictionary
 case_dict =                                                                     \
@@ -116,9 +104,9 @@ case_dict =
                     # Logistics ================================================
                     'case_dir'                     : '\'.\'',                   \
                     'run_time_info'                : 'T',                       \
-                    'nodes'                        : 1,                         \
+                    'nodes'                        : nodes,                     \
                     # processes per node... > 1 indicates parallel (avoid this for now)
-                    'ppn'                          : 1,                         \
+                    'ppn'                          : ppn,                       \
                     'queue'                        : 'normal',                  \
                     'walltime'                     : '24:00:00',                \
                     'mail_list'                    : '',                        \
@@ -165,9 +153,13 @@ case_dict =
                                                                                \
                     # Formatted Database Files Structure Parameters ============
                     'format'                       : 1,                        \
-                    'precision'                    : 2,                        \
+                    'precision'                    : 1,                        \
                     'prim_vars_wrt'                :'T',                       \
-		    'parallel_io'                  :'F',                       \
+		    'parallel_io'                  :'T',                       \
+                    # one MPI-IO aggregator (cb_nodes) per 8 processes
+                    'io_aggregators'               : max(1, nodes*ppn//8),     \
+                    # align collective writes to 1 MiB file system stripes
+                    'io_stripe_size'               : 1048576,                  \
 	            'fd_order'                     : 1,                       \
                     #'schlieren_wrt'                :'T',                      \
 		    'probe_wrt'                    :'T',                   \
@@ -287,7 +279,23 @@ case_dict =
                     # ==========================================================
     }
 
-# Executing MFC component
-f_execute_mfc_component(comp_name, case_dict, mfc_dir, engine)
+# Executing MFC component when run as a script. A parameter sweep may instead
+# import case_dict and mfc_dir and call f_execute_mfc_component itself, from
+# within the directory in which the case is to be run.
+if __name__ == '__main__':
+    
+    # Navigating to script directory
+    chdir(case_dir)
+    
+    print('pa',pa)
+    
+    # Selecting MFC component
+    comp_name = argv[1].strip()
+    
+    # Serial or parallel computational engine
+    engine = 'serial'
+    if (comp_name=='pre_process'): engine = 'serial'
+    
+    f_execute_mfc_component(comp_name, case_dict, mfc_dir, engine)
 
 # ==============================================================================
@@ -18,6 +18,9 @@ from os import getcwd
 # Command used to query the name of the current working directory
 from os.path import basename
 
+# Command used to check whether a file exists
+from os.path import isfile
+
 # Output piping parameter and command-line execution function, respectively
 from subprocess import PIPE, Popen
 
@@ -67,6 +70,8 @@ pre_process_dict =                                                             \
                     'weno_order'                    : None,                    \
                     'precision'                     : None,                    \
                     'parallel_io'                   : None,                    \
+                    'io_aggregators'                : None,                    \
+                    'io_stripe_size'                : None,                    \
                     'perturb_flow'                  : None,                    \
                     'perturb_flow_fluid'            : None,                    \
                     'perturb_sph'                   : None,                    \
@@ -927,6 +932,8 @@ simulation_dict =                                                              \
                     'We_wave_speeds'                : None,                    \
                     'lsq_deriv'                     : None,                    \
                     'parallel_io'                   : None,                    \
+                    'io_aggregators'                : None,                    \
+                    'io_stripe_size'                : None,                    \
                     'precision'                     : None,                    \
                     'bc_x%beg'                      : None,                    \
                     'bc_x%end'                      : None,                    \
@@ -1778,50 +1785,56 @@ def f_create_input_file(comp_name, case_dict): # -------------------------------
     global pre_process_dict, simulation_dict, post_process_dict
     
     
-    # Updating the values in the relevant MFC component dictionary using the
-    # values provided by the user in the case dictionary
+    # Populating a blank copy of the relevant MFC component dictionary with the
+    # values provided by the user in the case dictionary, so that parameters of
+    # a case previously executed from the same interpreter do not carry over
     if comp_name == 'pre_process':
-        for parameter in case_dict:
-            if parameter in pre_process_dict:
-                pre_process_dict[parameter] = case_dict[parameter]
-        comp_dict = pre_process_dict
+        comp_template = pre_process_dict
     elif comp_name == 'simulation':
-        for parameter in case_dict:
-            if parameter in simulation_dict:
-                simulation_dict[parameter] = case_dict[parameter]
-        comp_dict = simulation_dict
+        comp_template = simulation_dict
     else:
-        for parameter in case_dict:
-            if parameter in post_process_dict:
-                post_process_dict[parameter] = case_dict[parameter]
-        comp_dict = post_process_dict
+        comp_template = post_process_dict
+
+    comp_dict = comp_template.copy()
+    for parameter in case_dict:
+        if parameter in comp_dict:
+            comp_dict[parameter] = case_dict[parameter]
     
     
     # Setting the location of the input file
     file_loc = comp_name + '.inp'
     
     
-    # Opening and obtaining a handle for it
-    file_id = open(file_loc, 'w')
-    
-    
     # Populating the file's header information
-    file_id.write('&user_inputs\n')
+    contents = '&user_inputs\n'
     
     
-    # Populating the body of the input file
-    for parameter in comp_dict:
+    # Populating the body of the input file, listing the parameters in the order
+    # in which they appear in the MFC component dictionary
+    for parameter in comp_template:
         if comp_dict[parameter] is not None:
-            file_id.write(parameter + ' = ' + str(comp_dict[parameter]) + '\n')
+            contents += parameter + ' = ' + str(comp_dict[parameter]) + '\n'
     
     # OTS: end statement for namelist [gfortran compatibility]
-    file_id.write('&end\n')
+    contents += '&end\n'
     
     # Populating the file's footer information
-    file_id.write('/')
+    contents += '/'
+    
     
+    # Leaving the input file untouched if an identical one was already written
+    # by a previous run of the same case
+    if isfile(file_loc):
+        file_id = open(file_loc, 'r')
+        old_contents = file_id.read()
+        file_id.close()
+        if old_contents == contents:
+            return
     
-    # Closing the input file
+    
+    # Opening the input file, writing its contents and closing it
+    file_id = open(file_loc, 'w')
+    file_id.write(contents)
     file_id.close()
 # END: def f_create_input_file -------------------------------------------------
 
@@ -470,16 +470,15 @@ MODULE m_data_output
             
             
             ! Modifiying the value of the precision variable, which is used to
-            ! indicate the floating point precision of the data that is stored
-            ! in the formatted database file(s). This is performed so that this
-            ! variable may be directly used as input to the functions that are
-            ! in charge of writing the data. Only possible for Silo-HDF5 format.
+            ! indicate the floating point precision of the data that is passed
+            ! to the functions that are in charge of writing the data. Since
+            ! the flow variables and the grid are always held in double
+            ! precision, single precision output is obtained by having Silo
+            ! narrow the data while it is written to the database file(s),
+            ! which halves their size. Only possible for Silo-HDF5 format.
              IF(format == 1) THEN
-                IF(precision == 1) THEN          ! Single precision
-                    precision = DB_FLOAT
-                ELSE
-                    precision = DB_DOUBLE        ! Double precision
-                END IF
+                IF(precision == 1) ierr = DBFORCESINGLE(1)  ! Single precision
+                precision = DB_DOUBLE
              END IF
              
              
@@ -280,14 +280,14 @@ MODULE m_initial_condition
 
             IF (mpp_lim .AND. bubbles) THEN
                 !adjust volume fractions, according to modeled gas void fraction
-                alf_sum%sf = 0d0
+                alf_sum%sf(j,k,l) = 0d0
                 DO i = adv_idx%beg, adv_idx%end - 1
-                    alf_sum%sf = alf_sum%sf + q_prim_vf(i)%sf
+                    alf_sum%sf(j,k,l) = alf_sum%sf(j,k,l) + q_prim_vf(i)%sf(j,k,l)
                 END DO
 
                 DO i = adv_idx%beg, adv_idx%end-1
-                    q_prim_vf(i)%sf = q_prim_vf(i)%sf * (1.d0 - q_prim_vf(alf_idx)%sf) &
-                            / alf_sum%sf
+                    q_prim_vf(i)%sf(j,k,l) = q_prim_vf(i)%sf(j,k,l) * &
+                            (1.d0 - q_prim_vf(alf_idx)%sf(j,k,l)) / alf_sum%sf(j,k,l)
                 END DO
             END IF
                 
@@ -307,14 +307,14 @@ MODULE m_initial_condition
 
             IF (mpp_lim .AND. bubbles) THEN
                 !adjust volume fractions, according to modeled gas void fraction
-                alf_sum%sf = 0d0
+                alf_sum%sf(j,k,l) = 0d0
                 DO i = adv_idx%beg, adv_idx%end - 1
-                    alf_sum%sf = alf_sum%sf + q_prim_vf(i)%sf
+                    alf_sum%sf(j,k,l) = alf_sum%sf(j,k,l) + q_prim_vf(i)%sf(j,k,l)
                 END DO
 
                 DO i = adv_idx%beg, adv_idx%end-1
-                    q_prim_vf(i)%sf = q_prim_vf(i)%sf * (1.d0 - q_prim_vf(alf_idx)%sf) &
-                            / alf_sum%sf
+                    q_prim_vf(i)%sf(j,k,l) = q_prim_vf(i)%sf(j,k,l) * &
+                            (1.d0 - q_prim_vf(alf_idx)%sf(j,k,l)) / alf_sum%sf(j,k,l)
                 END DO
             END IF
             
@@ -394,14 +394,14 @@ MODULE m_initial_condition
 
             IF (mpp_lim .AND. bubbles) THEN
                 !adjust volume fractions, according to modeled gas void fraction
-                alf_sum%sf = 0d0
+                alf_sum%sf(j,k,l) = 0d0
                 DO i = adv_idx%beg, adv_idx%end - 1
-                    alf_sum%sf = alf_sum%sf + q_prim_vf(i)%sf
+                    alf_sum%sf(j,k,l) = alf_sum%sf(j,k,l) + q_prim_vf(i)%sf(j,k,l)
                 END DO
 
                 DO i = adv_idx%beg, adv_idx%end-1
-                    q_prim_vf(i)%sf = q_prim_vf(i)%sf * (1.d0 - q_prim_vf(alf_idx)%sf) &
-                            / alf_sum%sf
+                    q_prim_vf(i)%sf(j,k,l) = q_prim_vf(i)%sf(j,k,l) * &
+                            (1.d0 - q_prim_vf(alf_idx)%sf(j,k,l)) / alf_sum%sf(j,k,l)
                 END DO
             END IF
 
@@ -462,14 +462,14 @@ MODULE m_initial_condition
 
             IF (mpp_lim .AND. bubbles) THEN
                 !adjust volume fractions, according to modeled gas void fraction
-                alf_sum%sf = 0d0
+                alf_sum%sf(j,k,l) = 0d0
                 DO i = adv_idx%beg, adv_idx%end - 1
-                    alf_sum%sf = alf_sum%sf + q_prim_vf(i)%sf
+                    alf_sum%sf(j,k,l) = alf_sum%sf(j,k,l) + q_prim_vf(i)%sf(j,k,l)
                 END DO
 
                 DO i = adv_idx%beg, adv_idx%end-1
-                    q_prim_vf(i)%sf = q_prim_vf(i)%sf * (1.d0 - q_prim_vf(alf_idx)%sf) &
-                            / alf_sum%sf
+                    q_prim_vf(i)%sf(j,k,l) = q_prim_vf(i)%sf(j,k,l) * &
+                            (1.d0 - q_prim_vf(alf_idx)%sf(j,k,l)) / alf_sum%sf(j,k,l)
                 END DO
             END IF
 
@@ -548,14 +548,14 @@ MODULE m_initial_condition
 
             IF (mpp_lim .AND. bubbles) THEN
                 !adjust volume fractions, according to modeled gas void fraction
-                alf_sum%sf = 0d0
+                alf_sum%sf(j,k,l) = 0d0
                 DO i = adv_idx%beg, adv_idx%end - 1
-                    alf_sum%sf = alf_sum%sf + q_prim_vf(i)%sf
+                    alf_sum%sf(j,k,l) = alf_sum%sf(j,k,l) + q_prim_vf(i)%sf(j,k,l)
                 END DO
 
                 DO i = adv_idx%beg, adv_idx%end-1
-                    q_prim_vf(i)%sf = q_prim_vf(i)%sf * (1.d0 - q_prim_vf(alf_idx)%sf) &
-                            / alf_sum%sf
+                    q_prim_vf(i)%sf(j,k,l) = q_prim_vf(i)%sf(j,k,l) * &
+                            (1.d0 - q_prim_vf(alf_idx)%sf(j,k,l)) / alf_sum%sf(j,k,l)
                 END DO
             END IF
 
@@ -97,7 +97,8 @@ MODULE m_start_up
                                    adv_alphan, mpp_lim,                       &
                                    weno_order, bc_x, bc_y, bc_z, num_patches, &
                                    hypoelasticity, patch_icpp, fluid_pp,      &
-                                   precision, parallel_io,                    &
+                                   precision, parallel_io, io_aggregators,    &
+                                   io_stripe_size,                            &
                                    perturb_flow, perturb_flow_fluid,          &
                                    perturb_sph, perturb_sph_fluid, fluid_rho, &
                                    cyl_coord, loops_x, loops_y, loops_z,      &
@@ -813,6 +814,27 @@ MODULE m_start_up
                     END IF
                 END DO
             END IF
+            
+            ! Constraints on the parallel I/O hints
+            IF(io_aggregators /= dflt_int .AND. io_aggregators < 1) THEN
+                PRINT '(A)', 'Unsupported choice for the value of '         // &
+                             'io_aggregators. Exiting ...'
+                CALL s_mpi_abort()
+            ELSEIF(io_aggregators /= dflt_int .AND. (parallel_io .NEQV. .TRUE.)) THEN
+                PRINT '(A)', 'Unsupported choice of the combination of '    // &
+                             'values for io_aggregators and parallel_io. '  // &
+                             'Exiting ...'
+                CALL s_mpi_abort()
+            ELSEIF(io_stripe_size /= dflt_int .AND. io_stripe_size < 1) THEN
+                PRINT '(A)', 'Unsupported choice for the value of '         // &
+                             'io_stripe_size. Exiting ...'
+                CALL s_mpi_abort()
+            ELSEIF(io_stripe_size /= dflt_int .AND. (parallel_io .NEQV. .TRUE.)) THEN
+                PRINT '(A)', 'Unsupported choice of the combination of '    // &
+                             'values for io_stripe_size and parallel_io. '  // &
+                             'Exiting ...'
+                CALL s_mpi_abort()
+            END IF
                                             
             
             ! Constraints on the geometric initial condition patch parameters
@@ -1826,6 +1826,11 @@ MODULE m_data_output
             REAL(KIND(0d0)) :: tmp !<
             !! Temporary variable to store quantity for mpi_allreduce
 
+            REAL(KIND(0d0)), DIMENSION(num_dims+22) :: probe_loc, probe_glb !<
+            !! Local and reduced probe quantities, packed for mpi_allreduce
+
+            INTEGER :: nvals !< Number of packed probe quantities
+
             REAL(KIND(0d0)) :: blkmod1, blkmod2 !<
             !! Fluid bulk modulus for Woods mixture sound speed
 
@@ -1865,7 +1870,8 @@ MODULE m_data_output
                 M11 = 0d0
                 M02 = 0d0
                 varR = 0d0; varV = 0d0
-                alf = 0d0
+                alf = 0d0; alfgr = 0d0
+                ptilde = 0d0; ptot = 0d0
 
                 ! Find probe location in terms of indices on a
                 ! specific processor
@@ -2120,61 +2126,47 @@ MODULE m_data_output
                 END IF
 
                 IF (num_procs > 1) THEN
-                    tmp = rho
-                    CALL s_mpi_allreduce_sum(tmp,rho)
-                    DO s = 1, num_dims
-                        tmp = vel(s)
-                        CALL s_mpi_allreduce_sum(tmp,vel(s))
-                    END DO
-                    tmp = pres
-                    CALL s_mpi_allreduce_sum(tmp,pres)
-                    tmp = gamma
-                    CALL s_mpi_allreduce_sum(tmp,gamma)
-                    tmp = pi_inf
-                    CALL s_mpi_allreduce_sum(tmp,pi_inf)
-                    tmp = c
-                    CALL s_mpi_allreduce_sum(tmp,c)
-                    tmp = accel
-                    CALL s_mpi_allreduce_sum(tmp,accel)
-
+                    ! Packing the probe quantities into a single buffer so that
+                    ! they are summed across processors with one reduction
+                    nvals = num_dims + 6
+                    probe_loc(1:num_dims) = vel(1:num_dims)
+                    probe_loc(num_dims+1:nvals) = (/ rho, pres, gamma,   &
+                                                     pi_inf, c, accel /)
                     IF (bubbles) THEN
-                        tmp = alf
-                        CALL s_mpi_allreduce_sum(tmp,alf)
-                        tmp = alfgr
-                        CALL s_mpi_allreduce_sum(tmp,alfgr)
-                        tmp = nbub
-                        CALL s_mpi_allreduce_sum(tmp,nbub)
-                        tmp = nR(1)
-                        CALL s_mpi_allreduce_sum(tmp,nR(1))
-                        tmp = nRdot(1)
-                        CALL s_mpi_allreduce_sum(tmp,nRdot(1))
-                        tmp = M00
-                        CALL s_mpi_allreduce_sum(tmp,M00)
-                        tmp = R(1)
-                        CALL s_mpi_allreduce_sum(tmp,R(1))
-                        tmp = Rdot(1)
-                        CALL s_mpi_allreduce_sum(tmp,Rdot(1))
-                        tmp = ptilde
-                        CALL s_mpi_allreduce_sum(tmp,ptilde)
-                        tmp = ptot
-                        CALL s_mpi_allreduce_sum(tmp,ptot)
-
-                        IF (qbmm) THEN
-                            tmp = varR
-                            CALL s_mpi_allreduce_sum(tmp,varR)
-                            tmp = varV
-                            CALL s_mpi_allreduce_sum(tmp,varV)
-
-                            tmp = M10
-                            CALL s_mpi_allreduce_sum(tmp,M10)
-                            tmp = M01
-                            CALL s_mpi_allreduce_sum(tmp,M01)
-                            tmp = M20
-                            CALL s_mpi_allreduce_sum(tmp,M20)
-                            tmp = M02
-                            CALL s_mpi_allreduce_sum(tmp,M02)
+                        probe_loc(nvals+1:nvals+16) = (/ alf, alfgr, nbub,  &
+                                            nR(1), nRdot(1), M00, R(1), &
+                                            Rdot(1), ptilde, ptot, varR, &
+                                            varV, M10, M01, M20, M02 /)
+                        nvals = nvals + 16
+                    END IF
 
-                        END IF
+                    CALL s_mpi_allreduce_vectors_sum(probe_loc, probe_glb, nvals)
+
+                    vel(1:num_dims) = probe_glb(1:num_dims)
+                    rho    = probe_glb(num_dims+1)
+                    pres   = probe_glb(num_dims+2)
+                    gamma  = probe_glb(num_dims+3)
+                    pi_inf = probe_glb(num_dims+4)
+                    c      = probe_glb(num_dims+5)
+                    accel  = probe_glb(num_dims+6)
+                    IF (bubbles) THEN
+                        s = num_dims + 6
+                        alf      = probe_glb(s+1)
+                        alfgr    = probe_glb(s+2)
+                        nbub     = probe_glb(s+3)
+                        nR(1)    = probe_glb(s+4)
+                        nRdot(1) = probe_glb(s+5)
+                        M00      = probe_glb(s+6)
+                        R(1)     = probe_glb(s+7)
+                        Rdot(1)  = probe_glb(s+8)
+                        ptilde   = probe_glb(s+9)
+                        ptot     = probe_glb(s+10)
+                        varR     = probe_glb(s+11)
+                        varV     = probe_glb(s+12)
+                        M10      = probe_glb(s+13)
+                        M01      = probe_glb(s+14)
+                        M20      = probe_glb(s+15)
+                        M02      = probe_glb(s+16)
                     END IF
                 END IF
 
@@ -140,6 +140,8 @@ MODULE m_global_parameters
 
     LOGICAL :: parallel_io !< Format of the data files
     INTEGER :: precision !< Precision of output files
+    INTEGER :: io_aggregators !< Number of MPI-IO aggregators (cb_nodes hint)
+    INTEGER :: io_stripe_size !< File system stripe size in bytes (striping_unit hint)
 
     INTEGER, ALLOCATABLE, DIMENSION(:) :: proc_coords !<
     !! Processor coordinates in MPI_CART_COMM
@@ -389,6 +391,8 @@ MODULE m_global_parameters
             lsq_deriv        = .FALSE.
             parallel_io      = .FALSE.
             precision        = 2
+            io_aggregators   = dflt_int
+            io_stripe_size   = dflt_int
             hypoelasticity   = .FALSE.
             
             bc_x%beg = dflt_int; bc_x%end = dflt_int
@@ -1048,6 +1052,12 @@ MODULE m_global_parameters
         !> Initializes parallel infrastructure
         SUBROUTINE s_initialize_parallel_io() ! --------------------------------
 
+            CHARACTER(LEN = name_len) :: cb_nodes !<
+            !! String form of io_aggregators passed as the cb_nodes hint
+
+            CHARACTER(LEN = name_len) :: striping_unit !<
+            !! String form of io_stripe_size passed as the striping_unit hint
+
             num_dims = 1 + MIN(1,n) + MIN(1,p)
 
             ALLOCATE(proc_coords(1:num_dims))
@@ -1060,6 +1070,21 @@ MODULE m_global_parameters
             CALL MPI_INFO_CREATE(mpi_info_int, ierr)
             CALL MPI_INFO_SET(mpi_info_int, 'romio_ds_write', 'disable', ierr)
 
+            ! Funnel collective writes through a subset of the ranks so that
+            ! the file system sees io_aggregators writers instead of num_procs
+            IF (io_aggregators /= dflt_int) THEN
+                WRITE(cb_nodes, '(I0)') io_aggregators
+                CALL MPI_INFO_SET(mpi_info_int, 'romio_cb_write', 'enable', ierr)
+                CALL MPI_INFO_SET(mpi_info_int, 'cb_nodes', TRIM(cb_nodes), ierr)
+            END IF
+
+            ! Stripe data files in io_stripe_size bytes so that collective
+            ! writes are aligned to the file system stripes
+            IF (io_stripe_size /= dflt_int) THEN
+                WRITE(striping_unit, '(I0)') io_stripe_size
+                CALL MPI_INFO_SET(mpi_info_int, 'striping_unit', TRIM(striping_unit), ierr)
+            END IF
+
             ! Option for UNIX file system (Hooke/Thomson)
             ! WRITE(mpiiofs, '(A)') '/ufs_'
             ! mpiiofs = TRIM(mpiiofs)
@@ -283,6 +283,10 @@ MODULE m_mpi_proxy
                                            0, MPI_COMM_WORLD, ierr  )
             CALL MPI_BCAST(precision      , 1, MPI_INTEGER         , &
                                            0, MPI_COMM_WORLD, ierr  )
+            CALL MPI_BCAST(io_aggregators, 1, MPI_INTEGER         , &
+                                           0, MPI_COMM_WORLD, ierr  )
+            CALL MPI_BCAST(io_stripe_size, 1, MPI_INTEGER         , &
+                                           0, MPI_COMM_WORLD, ierr  )
             CALL MPI_BCAST(hypoelasticity, 1, MPI_LOGICAL         , &
                                             0, MPI_COMM_WORLD,ierr   )
             
@@ -1131,6 +1135,27 @@ MODULE m_mpi_proxy
 
 
 
+        !>  The following subroutine takes the input local array
+        !!      from all processors and reduces each of its entries
+        !!      to the sum of all values, using a single reduction.
+        !!  @param var_loc Array containing the local values which should be
+        !!  reduced amongst all the processors in the communicator.
+        !!  @param var_glb The globally reduced values
+        !!  @param num_vars Number of entries of the arrays to reduce
+        SUBROUTINE s_mpi_allreduce_vectors_sum(var_loc, var_glb, num_vars) ! --
+
+            INTEGER, INTENT(IN) :: num_vars
+            REAL(KIND(0d0)), DIMENSION(:), INTENT(IN) :: var_loc
+            REAL(KIND(0d0)), DIMENSION(:), INTENT(OUT) :: var_glb
+
+            ! Performing the reduction procedure
+            CALL MPI_ALLREDUCE(var_loc, var_glb, num_vars, MPI_DOUBLE_PRECISION, &
+                        MPI_SUM, MPI_COMM_WORLD, ierr)
+
+        END SUBROUTINE s_mpi_allreduce_vectors_sum ! ---------------------------
+
+
+
         !>  The following subroutine takes the input local variable
         !!      from all processors and reduces to the minimum of all
         !!      values. The reduced variable is recorded back onto the 
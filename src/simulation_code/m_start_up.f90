@@ -98,7 +98,8 @@ MODULE m_start_up
                                    tvd_wave_speeds, flux_lim, We_rhs_flux,   &
                                    We_riemann_flux, We_src, null_weights,    &
                                    We_wave_speeds, lsq_deriv, precision,     & 
-                                   parallel_io,                              &
+                                   parallel_io, io_aggregators,              &
+                                   io_stripe_size,                           &
                                    regularization, reg_eps, cyl_coord,       & 
                                    rhoref, pref, bubbles, bubble_model,      &
                                    R0ref, nb, Ca, Web, Re_inv,               &
@@ -616,6 +617,28 @@ MODULE m_start_up
             ! END: Finite Difference Parameters ================================
             
 
+            ! Constraints on the parallel I/O hints
+            IF(io_aggregators /= dflt_int .AND. io_aggregators < 1) THEN
+                PRINT '(A)', 'Unsupported choice for the value of '         // &
+                             'io_aggregators. Exiting ...'
+                CALL s_mpi_abort()
+            ELSEIF(io_aggregators /= dflt_int .AND. (parallel_io .NEQV. .TRUE.)) THEN
+                PRINT '(A)', 'Unsupported choice of the combination of '    // &
+                             'values for io_aggregators and parallel_io. '  // &
+                             'Exiting ...'
+                CALL s_mpi_abort()
+            ELSEIF(io_stripe_size /= dflt_int .AND. io_stripe_size < 1) THEN
+                PRINT '(A)', 'Unsupported choice for the value of '         // &
+                             'io_stripe_size. Exiting ...'
+                CALL s_mpi_abort()
+            ELSEIF(io_stripe_size /= dflt_int .AND. (parallel_io .NEQV. .TRUE.)) THEN
+                PRINT '(A)', 'Unsupported choice of the combination of '    // &
+                             'values for io_stripe_size and parallel_io. '  // &
+                             'Exiting ...'
+                CALL s_mpi_abort()
+            END IF
+            
+
 
             ! Fluids Physical Parameters =======================================
             DO i = 1, num_fluids_max